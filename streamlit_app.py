@@ -6,6 +6,17 @@ transcribes it using Amazon Transcribe, and converts the transcript into
 a Kiro specification format using Amazon Bedrock Claude 3.7.
 """
 
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import time
+import traceback
+
+import boto3
+import botocore.config
 import streamlit as st
 from utils import (
     upload_audio_to_s3,
@@ -15,49 +26,592 @@ from utils import (
     convert_transcript_to_spec,
     create_project_folder,
     upload_requirements_to_s3,
-    generate_unique_filename,
-    process_audio_input
+    check_bucket_async,
+    generate_unique_stem,
+    process_audio_input,
+    transcode_to_flac_16k_mono,
+    TRANSCODE_AVAILABLE
 )
 import os
 
+logger = logging.getLogger(__name__)
+
+# The working directory never changes while the server runs; resolve it once
+# instead of issuing a getcwd() syscall on every rerun
+CWD = os.getcwd()
+
+# Sentence boundaries used to break the transcript into paragraphs
+_SENT_RE = re.compile(r'([.?!]) ')
+
+# Word tokens for transcript statistics - counted via finditer so no list of
+# substrings is ever materialized
+_WORD_RE = re.compile(r'\S+')
+
+# The Bedrock stream delivers raw fragments of the forced tool-use input
+# JSON, so the markdown lives inside the still-escaped
+# specification_content string. This captures however much of that value
+# has arrived, stopping before any trailing half-finished escape
+_SPEC_VALUE_RE = re.compile(r'"specification_content"\s*:\s*"((?:[^"\\]|\\.)*)')
+
+# Static UI blobs hoisted to module scope so every rerun serializes the same
+# string objects instead of rebuilding multi-line literals, and each blob
+# ships as a single Streamlit element
+_HOW_IT_WORKS_MD = """
+### How it works:
+1. **Record** your project requirements using the microphone
+2. **Submit** to transcribe and generate a Kiro specification
+3. **Download** your structured requirements document
+"""
+
+_UPLOAD_DETAILS_MD = """**Process:**
+- Converting audio to WAV format
+- Generating unique filename with timestamp
+- Establishing secure connection to S3
+- Uploading with encryption in transit
+- Verifying upload completion"""
+
+_TRANSCRIBE_DETAILS_MD = """Amazon Transcribe is processing your audio file...
+
+The system polls at adaptive intervals for status updates.
+
+Transcription results will be displayed once processing completes."""
+
+_AI_DETAILS_MD = """**Current Tasks:**
+- Analyzing transcript for key requirements
+- Identifying user stories and acceptance criteria
+- Generating appropriate project name
+- Formatting in EARS (Easy Approach to Requirements Syntax)
+- Creating hierarchical requirement structure
+
+**Model:** Amazon Bedrock Claude 3.5 Sonnet
+
+**Expected Output:** Structured requirements.md file"""
+
+_NEXT_STEPS_MD_TEMPLATE = """
+**What's been created:**
+1. A new project folder named `{project}`
+2. A `requirements.md` file with your structured requirements in Kiro format
+
+**Recommended next steps:**
+1. Review the generated requirements document
+2. Use Kiro to create a design document from these requirements
+3. Generate implementation tasks and start coding
+4. Iterate and refine as needed
+
+**File Location:**
+```
+{cwd}/
+└── {project}/
+    └── requirements.md
+```
+"""
+
+_FOOTER_HTML = (
+    "<div style='text-align: center; color: #666;'>"
+    "Powered by Amazon Transcribe & Bedrock Claude Models"
+    "</div>"
+)
+
+# aioboto3 is optional - when it's available the upload/transcribe steps run
+# on an async session so the IO-bound AWS calls can overlap instead of
+# blocking the Streamlit thread serially. Without it we fall back to the
+# original synchronous pipeline.
+try:
+    import aioboto3
+    AIOBOTO3_AVAILABLE = True
+except ImportError:
+    AIOBOTO3_AVAILABLE = False
+
+# tenacity is optional - when available, AWS calls made from the submit
+# handler are wrapped with AWS-recommended "full jitter" exponential backoff
+# so transient throttling costs a short sleep instead of a full re-record.
+# The jitter also keeps concurrent Streamlit sessions from retrying in
+# lockstep. Without tenacity the calls run unwrapped as before.
+try:
+    from botocore.exceptions import ClientError
+    from tenacity import retry, wait_random_exponential, stop_after_attempt, retry_if_exception_type
+
+    aws_retry = retry(
+        wait=wait_random_exponential(multiplier=0.5, max=20),
+        stop=stop_after_attempt(5),
+        retry=retry_if_exception_type(ClientError),
+        reraise=True
+    )
+except ImportError:
+    def aws_retry(func):
+        return func
+
+# st.fragment (Streamlit 1.37+) scopes widget interactions inside a panel to
+# that panel's rerun instead of re-running the whole script. On older
+# versions the decorator is a no-op and the panels render inline as before;
+# reruns triggered inside a fragment then need scope='app' to reach the rest
+# of the page, so the kwargs are paired with the capability check.
+_fragment = getattr(st, 'fragment', None)
+if _fragment is None:
+    def _fragment(func):
+        return func
+    _APP_RERUN_KWARGS = {}
+else:
+    _APP_RERUN_KWARGS = {'scope': 'app'}
+
+
+@st.cache_resource
+def get_aws_clients():
+    """
+    Build the S3/Transcribe/Bedrock clients once per server process
+
+    Streamlit reruns the whole script on every widget interaction; without
+    caching, each submit would pay endpoint resolution, the credential chain
+    walk and a TLS handshake again. cache_resource keeps one set of clients
+    (and their keep-alive connection pools) alive across reruns and sessions.
+    """
+    config = botocore.config.Config(
+        region_name='us-east-1',
+        retries={'max_attempts': 5, 'mode': 'adaptive'},
+        tcp_keepalive=True
+    )
+    return {
+        's3': boto3.client('s3', config=config),
+        'transcribe': boto3.client('transcribe', config=config),
+        'bedrock': boto3.client('bedrock-runtime', config=config)
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_spec(transcript_sha256: str, transcript: str, model_id: str, _on_delta=None):
+    """
+    Memoized wrapper around convert_transcript_to_spec
+
+    Reruns with an identical transcript and model ID (common after an error
+    or while iterating on the UI) reuse the stored result instead of paying
+    another multi-second, billed Bedrock round-trip. The SHA-256 of the
+    transcript is passed explicitly so the cache key is cheap and stable.
+    The underscore prefix keeps the streaming callback out of the cache key.
+    """
+    clients = get_aws_clients()
+    return aws_retry(convert_transcript_to_spec)(transcript, model_id, client=clients['bedrock'], on_delta=_on_delta)
+
+
+@st.cache_data
+def _format_transcript(text: str) -> tuple[str, int, int, int]:
+    """
+    Break a transcript into sentence-separated paragraphs and compute stats
+
+    A single compiled-regex pass replaces three chained str.replace scans,
+    the word count walks the string with finditer instead of allocating a
+    list via str.split, and caching means the formatting, word/character
+    counts and duration estimate are computed once per transcript instead
+    of on every rerun.
+    """
+    stripped = text.strip()
+    formatted = _SENT_RE.sub(r'\1\n\n', stripped)
+    word_count = sum(1 for _ in _WORD_RE.finditer(stripped))
+    # Rough estimate: 150 spoken words per minute
+    estimated_duration = max(1, word_count // 150)
+    return formatted, word_count, len(stripped), estimated_duration
+
+
+@st.cache_data
+def _read_requirements(project_name: str, mtime: float) -> str:
+    """
+    Read a generated requirements.md, cached per (project, mtime)
+
+    Streamlit reruns the script on every interaction; without caching, the
+    success panel re-reads the whole markdown file from disk each time. The
+    mtime key means edits on disk still invalidate the cached content.
+    """
+    path = os.path.join(CWD, "projects", project_name, "requirements.md")
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+# Session state defaults shared by initialization (fill in missing keys on
+# every rerun) and reset (overwrite everything for a new recording)
+_SESSION_DEFAULTS = {
+    'processing_status': 'idle',  # idle, uploading, transcribing, generating, complete
+    'transcription_text': None,
+    'project_name': None,
+    'error_message': None,
+    'transcription_job_name': None,
+    'transcription_progress': None,
+    'input_method': None,  # 'microphone' or 'upload'
+    'selected_audio_data': None
+}
+
 
 def initialize_session_state():
     """Initialize session state variables for tracking processing status and input method"""
-    if 'processing_status' not in st.session_state:
-        st.session_state.processing_status = 'idle'  # idle, uploading, transcribing, generating, complete
-    if 'transcription_text' not in st.session_state:
-        st.session_state.transcription_text = None
-    if 'project_name' not in st.session_state:
-        st.session_state.project_name = None
-    if 'error_message' not in st.session_state:
-        st.session_state.error_message = None
-    if 'transcription_job_name' not in st.session_state:
-        st.session_state.transcription_job_name = None
-    if 'transcription_progress' not in st.session_state:
-        st.session_state.transcription_progress = None
-    if 'input_method' not in st.session_state:
-        st.session_state.input_method = None  # 'microphone' or 'upload'
-    if 'selected_audio_data' not in st.session_state:
-        st.session_state.selected_audio_data = None
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
 
 
 def reset_session_state():
     """Reset session state for a new recording"""
-    st.session_state.processing_status = 'idle'
-    st.session_state.transcription_text = None
-    st.session_state.project_name = None
-    st.session_state.error_message = None
-    st.session_state.transcription_job_name = None
-    st.session_state.transcription_progress = None
-    st.session_state.input_method = None
-    st.session_state.selected_audio_data = None
+    st.session_state.update(_SESSION_DEFAULTS)
+
+
+# Dispatch table for the processing panel: spinner caption, progress value,
+# step banner, static detail lines and optional (title, body) expander per
+# status. One renderer walks this instead of a long if/elif chain rebuilding
+# the same elements inline on every rerun.
+_STATUS_RENDERERS = {
+    'uploading': {
+        'spinner': "Uploading audio to cloud storage...",
+        'progress': 0.33,
+        'info': "⏳ **Step 1/3:** Uploading your audio file to secure cloud storage",
+        'details': (
+            "📤 Preparing audio data and establishing secure connection...\n\n"
+            "🔐 Encrypting audio file for secure transmission...\n\n"
+            "☁️ Uploading to Amazon S3..."
+        ),
+        'expander': ("🔧 Upload Details", _UPLOAD_DETAILS_MD)
+    },
+    'transcribing': {
+        'spinner': "Transcribing your audio...",
+        'progress': 0.66,
+        'info': "🎯 **Step 2/3:** Converting speech to text using AI transcription",
+        'details': None,  # rendered dynamically from transcription_progress
+        'expander': None  # rendered dynamically with the job name
+    },
+    'generating': {
+        'spinner': "Generating Kiro specification...",
+        'progress': 1.0,
+        'info': "✨ **Step 3/3:** Creating structured requirements document",
+        'details': (
+            "🤖 **Claude 3.5 Sonnet** is analyzing your requirements...\n\n"
+            "📝 Generating project name and detailed specifications...\n\n"
+            "🏗️ Structuring requirements in Kiro format..."
+        ),
+        'expander': ("🧠 AI Processing Details", _AI_DETAILS_MD)
+    }
+}
+
+
+def _render_transcription_progress():
+    """Render the live transcription progress details, if any"""
+    # The bar goes into a placeholder so the polling callback can update the
+    # mounted widget in place instead of tearing down and re-rendering the
+    # whole panel on every status check. The placeholder handle is only valid
+    # for the current script run, so main() resets it on each rerun.
+    progress_ph = st.empty()
+    st.session_state._progress_ph = progress_ph
+
+    if st.session_state.transcription_progress:
+        progress_info = st.session_state.transcription_progress
+        progress_value = progress_info.get('estimated_progress', 0.66)
+        elapsed_time = progress_info.get('elapsed_time', 0)
+        status = progress_info.get('status', 'IN_PROGRESS')
+        poll_count = progress_info.get('poll_count', 0)
+
+        # Progress bar with estimated completion
+        progress_ph.progress(progress_value)
+
+        # Detailed status information
+        # One markdown element per column - each st.write is a separate
+        # frontend element and websocket message, so the lines are batched
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown(f"🔊 Status: **{status}**  \n⏱️ Elapsed: **{int(elapsed_time)}s**")
+        with col2:
+            checks_line = f"🔄 Checks: **{poll_count}**"
+            if status == 'IN_PROGRESS':
+                checks_line += "  \n🎵 Processing audio..."
+            elif status == 'QUEUED':
+                checks_line += "  \n⏳ Waiting in queue..."
+            st.markdown(checks_line)
+    else:
+        # Default progress display
+        progress_ph.progress(0.66)
+        st.markdown(
+            "🔊 Analyzing audio patterns and generating transcript...\n\n"
+            "⏱️ This may take a few minutes depending on audio length"
+        )
+
+
+def _render_processing_status(status):
+    """
+    Render the processing panel for the given status
+
+    The terminal states (complete/error) are handled directly; the in-flight
+    states come from the _STATUS_RENDERERS dispatch table so every step goes
+    through one code path.
+    """
+    st.markdown("---")
+    st.subheader("📊 Processing Status")
+
+    if status == 'complete':
+        st.success("✅ Processing complete!")
+        st.progress(1.0)
+        return
+    if status == 'error':
+        st.error(f"❌ Error: {st.session_state.error_message}")
+        st.progress(0.0)
+        # The full traceback is only formatted when the user asks for it;
+        # the expensive frame walk never runs on the default error path
+        exc = st.session_state.get('_last_exception')
+        if exc is not None and st.toggle("Show technical details", key='_show_error_details'):
+            st.code(''.join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+        return
+
+    entry = _STATUS_RENDERERS.get(status)
+    if entry is None:
+        return
+
+    with st.spinner(entry['spinner']):
+        st.info(entry['info'])
+
+        if status == 'transcribing':
+            _render_transcription_progress()
+            if st.session_state.transcription_job_name:
+                with st.expander("🔧 Technical Details", expanded=False):
+                    st.code(f"Job Name: {st.session_state.transcription_job_name}")
+                    st.markdown(_TRANSCRIBE_DETAILS_MD)
+        else:
+            st.progress(entry['progress'])
+            st.markdown(entry['details'])
+            title, body = entry['expander']
+            with st.expander(title, expanded=False):
+                st.markdown(body)
+
+
+@_fragment
+def _render_transcription_results():
+    """Render the transcript panel with formatted text and metadata"""
+    st.markdown("---")
+    st.subheader("📝 Transcription Results")
+    with st.expander("View Transcribed Text", expanded=True):
+        # Format transcription for better readability (cached per transcript)
+        sentences, word_count, char_count, estimated_duration = _format_transcript(st.session_state.transcription_text)
+
+        st.markdown("**Transcribed Content:**")
+        st.text_area(
+            "Your spoken requirements have been converted to text:",
+            value=sentences,
+            height=200,
+            disabled=True,
+            help="This is the text extracted from your audio recording. Review it before proceeding to specification generation."
+        )
+
+        # Show transcription metadata
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Word Count", word_count)
+        with col2:
+            st.metric("Character Count", char_count)
+        with col3:
+            st.metric("Est. Duration", f"{estimated_duration} min")
+
+    # Show next step information
+    if st.session_state.processing_status == 'generating':
+        st.info("✨ Now generating your Kiro specification from this transcription...")
+    elif st.session_state.processing_status == 'complete':
+        st.success("✅ Specification generated successfully from this transcription!")
+
+
+@_fragment
+def _render_success_panel():
+    """Render the completed-project panel: downloads, reset and next steps"""
+    st.markdown("---")
+    st.subheader("🎉 Success!")
+
+    # Enhanced success messaging with detailed information
+    st.success("✅ **Project created successfully!**")
+
+    # Project details in an attractive info box
+    st.info(f"""
+    **📁 Project Name:** `{st.session_state.project_name}`
+
+    **📄 Files Created:**
+    - `{st.session_state.project_name}/requirements.md` - Your structured requirements document
+    """)
+
+    # Action buttons for downloads and next steps
+    col1, col2, col3 = st.columns(3)
+
+    # Download Specs button
+    with col1:
+        try:
+            requirements_path = os.path.join(CWD, "projects", st.session_state.project_name, "requirements.md")
+            if os.path.exists(requirements_path):
+                spec_content = _read_requirements(
+                    st.session_state.project_name,
+                    os.stat(requirements_path).st_mtime
+                )
+
+                st.download_button(
+                    label="📄 Download Specs",
+                    data=spec_content,
+                    file_name=f"{st.session_state.project_name}_requirements.md",
+                    mime="text/markdown",
+                    help="Download the generated requirements document",
+                    use_container_width=True
+                )
+            else:
+                st.button("📄 Download Specs", disabled=True, help="Requirements file not found", use_container_width=True)
+        except Exception as e:
+            st.button("📄 Download Specs", disabled=True, help=f"Error: {str(e)}", use_container_width=True)
+
+    # Download Transcript button
+    with col2:
+        if st.session_state.transcription_text:
+            st.download_button(
+                label="📝 Download Transcript",
+                data=st.session_state.transcription_text,
+                file_name=f"{st.session_state.project_name}_transcript.txt",
+                mime="text/plain",
+                help="Download the audio transcription text",
+                use_container_width=True
+            )
+        else:
+            st.button("📝 Download Transcript", disabled=True, help="No transcript available", use_container_width=True)
+
+    # Create Another Project button
+    with col3:
+        if st.button("🔄 New Project", help="Start over with a new recording", use_container_width=True):
+            reset_session_state()
+            st.rerun(**_APP_RERUN_KWARGS)
+
+    # Regenerate clears the memoized Bedrock result so the next submit
+    # re-invokes the model even for an identical transcript
+    if st.button("♻️ Regenerate Specification", help="Discard the cached result and generate a fresh specification from the same transcript"):
+        _cached_spec.clear()
+        st.session_state.processing_status = 'idle'
+        st.session_state.project_name = None
+        st.rerun(**_APP_RERUN_KWARGS)
+
+    # Additional helpful information - only show on localhost
+    try:
+        # Check if running on localhost
+        is_localhost = False
+
+        # Try to get the server instance and check if it's localhost
+        try:
+            # Get the current session info
+            session_info = st.runtime.get_instance()._session_mgr.list_sessions()
+            if session_info:
+                # Check if any session is running on localhost
+                is_localhost = any('localhost' in str(session) or '127.0.0.1' in str(session) for session in session_info)
+            else:
+                # Fallback: check environment or assume localhost for development
+                is_localhost = os.getenv('STREAMLIT_SERVER_ADDRESS', 'localhost') in ['localhost', '127.0.0.1']
+        except:
+            # Fallback: check if we're in a development environment
+            is_localhost = os.getenv('STREAMLIT_SERVER_ADDRESS', 'localhost') in ['localhost', '127.0.0.1']
+
+        if is_localhost:
+            with st.expander("📋 Next Steps", expanded=False):
+                st.markdown(_NEXT_STEPS_MD_TEMPLATE.format(
+                    project=st.session_state.project_name, cwd=CWD))
+    except Exception:
+        # If we can't determine the host, don't show the next steps section
+        pass
+
+
+async def _run_transcription_pipeline(audio_bytes, bucket_name, progress_callback=None, media_format='wav'):
+    """
+    Run the upload + transcription steps over a persistent aioboto3 session
+
+    The S3 and Transcribe clients are opened concurrently as async context
+    managers, the audio upload overlaps with job-name generation, and job
+    polling uses asyncio.sleep so the worker thread is never blocked.
+
+    Args:
+        audio_bytes: Audio file data as bytes
+        bucket_name: S3 bucket name to upload to
+        progress_callback: Optional callback function to report progress updates
+        media_format: Audio container format being uploaded ('wav' or 'flac')
+
+    Returns:
+        Tuple of (transcription_job_name, job_status_dict) where the status
+        dictionary matches the shape returned by poll_transcription_status
+    """
+    session = aioboto3.Session()
+    async with session.client('s3', region_name='us-east-1') as s3_client, \
+            session.client('transcribe', region_name='us-east-1') as transcribe_client:
+        # Generate the name stem off-thread while the clients warm up; the
+        # filename and job name both derive from it with no stripping
+        stem = await asyncio.to_thread(generate_unique_stem)
+        filename = f"{stem}.{media_format}"
+        job_name = f"transcription_{stem.replace('_', '-')}"
+
+        # Upload the audio file to S3
+        await s3_client.put_object(
+            Bucket=bucket_name,
+            Key=filename,
+            Body=audio_bytes,
+            ContentType=f'audio/{media_format}'
+        )
+        s3_uri = f"s3://{bucket_name}/{filename}"
+
+        # Start the transcription job
+        await transcribe_client.start_transcription_job(
+            TranscriptionJobName=job_name,
+            LanguageCode='en-US',
+            MediaFormat=media_format,
+            Media={
+                'MediaFileUri': s3_uri
+            },
+            OutputBucketName=bucket_name
+        )
+
+        # Poll for completion with non-blocking sleeps (30 minute timeout).
+        # Same jittered backoff as poll_transcription_status: short delays
+        # first so short clips return quickly, growing 1.5x per check up to
+        # a 30 second ceiling for long-running jobs.
+        timeout = 1800
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        poll_interval = 1.0
+        poll_count = 0
+
+        while True:
+            now = time.monotonic()
+            if now > deadline:
+                raise TimeoutError(f"Transcription job '{job_name}' timed out after {timeout} seconds")
+            elapsed_time = now - start_time
+
+            response = await transcribe_client.get_transcription_job(
+                TranscriptionJobName=job_name
+            )
+
+            job_status = response['TranscriptionJob']['TranscriptionJobStatus']
+            poll_count += 1
+
+            if progress_callback:
+                progress_callback({
+                    'status': job_status,
+                    'elapsed_time': elapsed_time,
+                    'poll_count': poll_count,
+                    'estimated_progress': min(elapsed_time / 300, 0.9)
+                })
+
+            result = {
+                'TranscriptionJobStatus': job_status,
+                'TranscriptionJobName': job_name
+            }
+
+            if job_status == 'COMPLETED':
+                result['TranscriptFileUri'] = response['TranscriptionJob']['Transcript']['TranscriptFileUri']
+                if progress_callback:
+                    progress_callback({'status': 'COMPLETED', 'estimated_progress': 1.0})
+                return job_name, result
+            elif job_status == 'FAILED':
+                result['FailureReason'] = response['TranscriptionJob'].get('FailureReason', 'Unknown failure reason')
+                return job_name, result
+            else:
+                await asyncio.sleep(poll_interval + random.uniform(0, 0.5))
+                poll_interval = min(30.0, poll_interval * 1.5)
 
 
 def main():
     """Main Streamlit application"""
     # Initialize session state
     initialize_session_state()
-    
+
+    # Placeholder handles don't survive a rerun; drop any stale one so the
+    # polling callback never writes to an unmounted widget
+    st.session_state._progress_ph = None
+
     # Page configuration and header
     st.set_page_config(
         page_title="Audio Transcription to Kiro Spec",
@@ -85,15 +639,20 @@ def main():
         help="Enter the Bedrock model ID to use for converting your transcript into structured requirements."
     )
     
+    # Fast mode transcodes audio to 16 kHz mono FLAC before upload - several
+    # times smaller than the 48 kHz WAV browsers record, which shrinks the
+    # upload and Transcribe ingestion accordingly
+    fast_mode = st.sidebar.toggle(
+        "⚡ Fast mode (16 kHz FLAC upload)",
+        value=False,
+        disabled=not TRANSCODE_AVAILABLE,
+        help="Transcode audio to 16 kHz mono FLAC before uploading. Requires the optional soundfile and scipy packages."
+    )
+
     st.markdown("---")
-    
+
     # Description section
-    st.markdown("""
-    ### How it works:
-    1. **Record** your project requirements using the microphone
-    2. **Submit** to transcribe and generate a Kiro specification
-    3. **Download** your structured requirements document
-    """)
+    st.markdown(_HOW_IT_WORKS_MD)
     
     st.markdown("---")
     
@@ -124,8 +683,16 @@ def main():
                 # Clear previous selections when switching methods
                 st.session_state.input_method = 'microphone'
                 st.session_state.selected_audio_data = recorded_audio
+
+            # Cache the raw bytes once per recording - getvalue() copies the
+            # whole buffer, so doing it on every rerun is a full memcpy each
+            # time the user touches any widget
+            audio_id = getattr(recorded_audio, 'file_id', None) or id(recorded_audio)
+            if st.session_state.get('_audio_id') != audio_id:
+                st.session_state.audio_bytes = recorded_audio.getvalue()
+                st.session_state._audio_id = audio_id
             current_audio_data = recorded_audio
-            
+
             # Show recording info
             st.success("✅ Audio recorded successfully!")
     
@@ -145,8 +712,15 @@ def main():
                 # Clear previous selections when switching methods
                 st.session_state.input_method = 'upload'
                 st.session_state.selected_audio_data = uploaded_file
+
+            # Cache the raw bytes once per uploaded file, keyed by file_id,
+            # so reruns don't re-copy a potentially multi-MB buffer
+            audio_id = getattr(uploaded_file, 'file_id', None) or id(uploaded_file)
+            if st.session_state.get('_audio_id') != audio_id:
+                st.session_state.audio_bytes = uploaded_file.getvalue()
+                st.session_state._audio_id = audio_id
             current_audio_data = uploaded_file
-            
+
             # Show upload info
             st.success("✅ File uploaded successfully!")
     
@@ -195,245 +769,22 @@ def main():
                 reset_session_state()
                 st.rerun()
     
-    # Processing status display with enhanced loading states
-    if st.session_state.processing_status != 'idle':
-        st.markdown("---")
-        st.subheader("📊 Processing Status")
-        
-        # Status indicators based on current processing stage with spinners
-        if st.session_state.processing_status == 'uploading':
-            with st.spinner("Uploading audio to cloud storage..."):
-                st.info("⏳ **Step 1/3:** Uploading your audio file to secure cloud storage")
-                # Progress bar for upload step
-                progress_bar = st.progress(0.33)
-                
-                # Detailed upload status
-                st.write("📤 Preparing audio data and establishing secure connection...")
-                st.write("🔐 Encrypting audio file for secure transmission...")
-                st.write("☁️ Uploading to Amazon S3...")
-                
-                # Show technical details
-                with st.expander("🔧 Upload Details", expanded=False):
-                    st.write("**Process:**")
-                    st.write("• Converting audio to WAV format")
-                    st.write("• Generating unique filename with timestamp")
-                    st.write("• Establishing secure connection to S3")
-                    st.write("• Uploading with encryption in transit")
-                    st.write("• Verifying upload completion")
-        elif st.session_state.processing_status == 'transcribing':
-            with st.spinner("Transcribing your audio..."):
-                st.info("🎯 **Step 2/3:** Converting speech to text using AI transcription")
-                
-                # Show detailed transcription progress if available
-                if st.session_state.transcription_progress:
-                    progress_info = st.session_state.transcription_progress
-                    progress_value = progress_info.get('estimated_progress', 0.66)
-                    elapsed_time = progress_info.get('elapsed_time', 0)
-                    status = progress_info.get('status', 'IN_PROGRESS')
-                    poll_count = progress_info.get('poll_count', 0)
-                    
-                    # Progress bar with estimated completion
-                    progress_bar = st.progress(progress_value)
-                    
-                    # Detailed status information
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.write(f"🔊 Status: **{status}**")
-                        st.write(f"⏱️ Elapsed: **{int(elapsed_time)}s**")
-                    with col2:
-                        st.write(f"🔄 Checks: **{poll_count}**")
-                        if status == 'IN_PROGRESS':
-                            st.write("🎵 Processing audio...")
-                        elif status == 'QUEUED':
-                            st.write("⏳ Waiting in queue...")
-                else:
-                    # Default progress display
-                    progress_bar = st.progress(0.66)
-                    st.write("🔊 Analyzing audio patterns and generating transcript...")
-                    st.write("⏱️ This may take a few minutes depending on audio length")
-                
-                # Show transcription job name if available
-                if st.session_state.transcription_job_name:
-                    with st.expander("🔧 Technical Details", expanded=False):
-                        st.code(f"Job Name: {st.session_state.transcription_job_name}")
-                        st.write("Amazon Transcribe is processing your audio file...")
-                        st.write("The system polls every 10 seconds for status updates.")
-                        st.write("Transcription results will be displayed once processing completes.")
-        elif st.session_state.processing_status == 'generating':
-            with st.spinner("Generating Kiro specification..."):
-                st.info("✨ **Step 3/3:** Creating structured requirements document")
-                # Progress bar for generation step
-                progress_bar = st.progress(1.0)
-                
-                # Detailed generation status
-                st.write("🤖 **Claude 3.5 Sonnet** is analyzing your requirements...")
-                st.write("📝 Generating project name and detailed specifications...")
-                st.write("🏗️ Structuring requirements in Kiro format...")
-                
-                # Show what the AI is doing
-                with st.expander("🧠 AI Processing Details", expanded=False):
-                    st.write("**Current Tasks:**")
-                    st.write("• Analyzing transcript for key requirements")
-                    st.write("• Identifying user stories and acceptance criteria")
-                    st.write("• Generating appropriate project name")
-                    st.write("• Formatting in EARS (Easy Approach to Requirements Syntax)")
-                    st.write("• Creating hierarchical requirement structure")
-                    
-                    st.write("**Model:** Amazon Bedrock Claude 3.5 Sonnet")
-                    st.write("**Expected Output:** Structured requirements.md file")
-        elif st.session_state.processing_status == 'complete':
-            st.success("✅ Processing complete!")
-            # Show completed progress
-            st.progress(1.0)
-        elif st.session_state.processing_status == 'error':
-            st.error(f"❌ Error: {st.session_state.error_message}")
-            # Show error state in progress
-            st.progress(0.0)
-    
-    # Display transcription results if available (before spec generation)
-    if st.session_state.transcription_text and st.session_state.processing_status in ['generating', 'complete']:
-        st.markdown("---")
-        st.subheader("📝 Transcription Results")
-        with st.expander("View Transcribed Text", expanded=True):
-            # Format transcription for better readability
-            formatted_text = st.session_state.transcription_text.strip()
-            
-            # Add basic formatting improvements
-            # Split into sentences for better readability
-            sentences = formatted_text.replace('. ', '.\n\n').replace('? ', '?\n\n').replace('! ', '!\n\n')
-            
-            st.markdown("**Transcribed Content:**")
-            st.text_area(
-                "Your spoken requirements have been converted to text:",
-                value=sentences,
-                height=200,
-                disabled=True,
-                help="This is the text extracted from your audio recording. Review it before proceeding to specification generation."
-            )
-            
-            # Show transcription metadata
-            word_count = len(formatted_text.split())
-            char_count = len(formatted_text)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Word Count", word_count)
-            with col2:
-                st.metric("Character Count", char_count)
-            with col3:
-                estimated_duration = max(1, word_count // 150)  # Rough estimate: 150 words per minute
-                st.metric("Est. Duration", f"{estimated_duration} min")
-        
-        # Show next step information
-        if st.session_state.processing_status == 'generating':
-            st.info("✨ Now generating your Kiro specification from this transcription...")
-        elif st.session_state.processing_status == 'complete':
-            st.success("✅ Specification generated successfully from this transcription!")
-    
-    # Display success message and project info
-    if st.session_state.processing_status == 'complete' and st.session_state.project_name:
-        st.markdown("---")
-        st.subheader("🎉 Success!")
-        
-        # Enhanced success messaging with detailed information
-        st.success("✅ **Project created successfully!**")
-        
-        # Project details in an attractive info box
-        st.info(f"""
-        **📁 Project Name:** `{st.session_state.project_name}`
-        
-        **📄 Files Created:**
-        - `{st.session_state.project_name}/requirements.md` - Your structured requirements document
-        """)
-        
-        # Action buttons for downloads and next steps
-        col1, col2, col3 = st.columns(3)
-        
-        # Download Specs button
-        with col1:
-            try:
-                requirements_path = os.path.join(os.getcwd(), "projects", st.session_state.project_name, "requirements.md")
-                if os.path.exists(requirements_path):
-                    with open(requirements_path, 'r', encoding='utf-8') as f:
-                        spec_content = f.read()
-                    
-                    st.download_button(
-                        label="📄 Download Specs",
-                        data=spec_content,
-                        file_name=f"{st.session_state.project_name}_requirements.md",
-                        mime="text/markdown",
-                        help="Download the generated requirements document",
-                        use_container_width=True
-                    )
-                else:
-                    st.button("📄 Download Specs", disabled=True, help="Requirements file not found", use_container_width=True)
-            except Exception as e:
-                st.button("📄 Download Specs", disabled=True, help=f"Error: {str(e)}", use_container_width=True)
-        
-        # Download Transcript button
-        with col2:
-            if st.session_state.transcription_text:
-                st.download_button(
-                    label="📝 Download Transcript",
-                    data=st.session_state.transcription_text,
-                    file_name=f"{st.session_state.project_name}_transcript.txt",
-                    mime="text/plain",
-                    help="Download the audio transcription text",
-                    use_container_width=True
-                )
-            else:
-                st.button("📝 Download Transcript", disabled=True, help="No transcript available", use_container_width=True)
-        
-        # Create Another Project button
-        with col3:
-            if st.button("🔄 New Project", help="Start over with a new recording", use_container_width=True):
-                reset_session_state()
-                st.rerun()
-        
-        # Additional helpful information - only show on localhost
-        try:
-            # Check if running on localhost
-            import streamlit.web.server.server as server
-            is_localhost = False
-            
-            # Try to get the server instance and check if it's localhost
-            try:
-                # Get the current session info
-                session_info = st.runtime.get_instance()._session_mgr.list_sessions()
-                if session_info:
-                    # Check if any session is running on localhost
-                    is_localhost = any('localhost' in str(session) or '127.0.0.1' in str(session) for session in session_info)
-                else:
-                    # Fallback: check environment or assume localhost for development
-                    is_localhost = os.getenv('STREAMLIT_SERVER_ADDRESS', 'localhost') in ['localhost', '127.0.0.1']
-            except:
-                # Fallback: check if we're in a development environment
-                is_localhost = os.getenv('STREAMLIT_SERVER_ADDRESS', 'localhost') in ['localhost', '127.0.0.1']
-            
-            if is_localhost:
-                with st.expander("📋 Next Steps", expanded=False):
-                    st.markdown(f"""
-                    **What's been created:**
-                    1. A new project folder named `{st.session_state.project_name}`
-                    2. A `requirements.md` file with your structured requirements in Kiro format
-                    
-                    **Recommended next steps:**
-                    1. Review the generated requirements document
-                    2. Use Kiro to create a design document from these requirements
-                    3. Generate implementation tasks and start coding
-                    4. Iterate and refine as needed
-                    
-                    **File Location:**
-                    ```
-                    {os.getcwd()}/
-                    └── {st.session_state.project_name}/
-                        └── requirements.md
-                    ```
-                    """)
-        except Exception:
-            # If we can't determine the host, don't show the next steps section
-            pass
-    
+    # Processing status panel - rendered into a placeholder so the submit
+    # workflow below can update it in place as steps advance, making this
+    # the single source of truth for per-step banners and progress
+    status_placeholder = st.empty()
+    status = st.session_state.processing_status
+    if status != 'idle':
+        # Idle is the hottest rerun path (every keystroke before submit);
+        # one guard skips the whole post-submit render tree instead of
+        # re-evaluating each panel's condition separately
+        with status_placeholder.container():
+            _render_processing_status(status)
+        if st.session_state.transcription_text and status in ('generating', 'complete'):
+            _render_transcription_results()
+        if status == 'complete' and st.session_state.project_name:
+            _render_success_panel()
+
     # Processing workflow - orchestrate the complete audio-to-spec pipeline
     if submit_button and audio_data is not None:
         try:
@@ -445,49 +796,77 @@ def main():
                 st.rerun()
                 return
             
-            # Step 1: Upload audio to S3 with loading state
-            st.session_state.processing_status = 'uploading'
-            
-            # Show upload progress immediately
-            with st.spinner("Uploading audio to cloud storage..."):
-                st.info("⏳ **Step 1/3:** Uploading your audio file to secure cloud storage")
-                
-                # Generate unique filename and upload to S3
-                filename = generate_unique_filename()
-                
-                # Handle both input methods - get audio bytes using utility function
-                if st.session_state.input_method == 'microphone':
-                    audio_bytes = audio_data.getvalue()
-                    st.write(f"🎙️ Processing microphone recording")
-                elif st.session_state.input_method == 'upload':
-                    audio_bytes = audio_data.getvalue()
-                    st.write(f"📁 Processing uploaded file")
-                else:
-                    # Fallback for direct audio_data
-                    audio_bytes = audio_data.getvalue()
-                    st.write(f"🎵 Processing audio input")
-                
-                s3_uri = upload_audio_to_s3(audio_bytes, bucket_name, filename)
-                st.write(f"✅ Upload successful")
-            
-            # Step 2: Start transcription job with enhanced progress tracking
-            st.session_state.processing_status = 'transcribing'
-            
-            with st.spinner("Starting transcription job..."):
-                st.info("🎯 **Step 2/3:** Converting speech to text using AI transcription")
-                
-                # Create unique job name based on filename
-                job_name = f"transcription_{filename.replace('.wav', '').replace('_', '-')}"
-                transcription_job_name = start_transcription_job(s3_uri, job_name)
-                st.session_state.transcription_job_name = transcription_job_name
-            
-            # Poll for transcription completion with progress tracking
-            with st.spinner("Transcribing your audio..."):
-                # Define progress callback for transcription polling
-                def update_transcription_progress(progress_info):
-                    st.session_state.transcription_progress = progress_info
-                
-                job_status = poll_transcription_status(transcription_job_name, update_transcription_progress)
+            clients = get_aws_clients()
+
+            # Define progress callback for transcription polling. Besides
+            # recording the latest poll result, it nudges the mounted
+            # progress bar in place so the user sees movement between polls
+            # without a full panel re-render.
+            def update_transcription_progress(progress_info):
+                st.session_state.transcription_progress = progress_info
+                progress_ph = st.session_state.get('_progress_ph')
+                if progress_ph is not None:
+                    progress_ph.progress(progress_info.get('estimated_progress', 0.66))
+
+            def advance_status(new_status):
+                # Single source of truth: update the state and re-render the
+                # status panel in place instead of emitting duplicate banners
+                st.session_state.processing_status = new_status
+                with status_placeholder.container():
+                    _render_processing_status(new_status)
+
+            if AIOBOTO3_AVAILABLE:
+                # Async fast path: upload, job start and polling run on one
+                # persistent async session without blocking between steps
+                advance_status('uploading')
+
+                with st.spinner("Uploading and transcribing your audio..."):
+                    audio_bytes = st.session_state.audio_bytes
+                    media_format = 'wav'
+                    if fast_mode:
+                        audio_bytes = transcode_to_flac_16k_mono(audio_bytes)
+                        media_format = 'flac'
+                    advance_status('transcribing')
+                    transcription_job_name, job_status = asyncio.run(
+                        _run_transcription_pipeline(audio_bytes, bucket_name, update_transcription_progress, media_format)
+                    )
+                    st.session_state.transcription_job_name = transcription_job_name
+            else:
+                # Step 1: Upload audio to S3 with loading state
+                advance_status('uploading')
+
+                with st.spinner("Uploading audio to cloud storage..."):
+                    # Generate a unique stem; the filename and job name both
+                    # derive from it so no extension stripping is needed
+                    stem = generate_unique_stem()
+
+                    # In fast mode, transcode to 16 kHz mono FLAC first;
+                    # otherwise hand the file object straight to the uploader
+                    # so it streams in multipart chunks without a copy
+                    upload_payload = audio_data
+                    media_format = 'wav'
+                    if fast_mode:
+                        upload_payload = transcode_to_flac_16k_mono(st.session_state.audio_bytes)
+                        media_format = 'flac'
+                    filename = f"{stem}.{media_format}"
+
+                    s3_uri = aws_retry(upload_audio_to_s3)(
+                        upload_payload, bucket_name, filename,
+                        client=clients['s3'], content_type=f'audio/{media_format}'
+                    )
+
+                # Step 2: Start transcription job with enhanced progress tracking
+                advance_status('transcribing')
+
+                with st.spinner("Starting transcription job..."):
+                    # Create unique job name from the same stem
+                    job_name = f"transcription_{stem.replace('_', '-')}"
+                    transcription_job_name = aws_retry(start_transcription_job)(s3_uri, job_name, client=clients['transcribe'], media_format=media_format)
+                    st.session_state.transcription_job_name = transcription_job_name
+
+                # Poll for transcription completion with progress tracking
+                with st.spinner("Transcribing your audio..."):
+                    job_status = aws_retry(poll_transcription_status)(transcription_job_name, update_transcription_progress, client=clients['transcribe'])
             
             if job_status['TranscriptionJobStatus'] != 'COMPLETED':
                 error_reason = job_status.get('FailureReason', 'Unknown transcription failure')
@@ -497,47 +876,76 @@ def main():
                 return
             
             # Get transcription result
-            transcription_text = get_transcription_result(transcription_job_name)
+            transcription_text = aws_retry(get_transcription_result)(transcription_job_name, transcribe_client=clients['transcribe'], s3_client=clients['s3'])
             st.session_state.transcription_text = transcription_text
             
             # Step 3: Generate specification using Bedrock with loading state
-            st.session_state.processing_status = 'generating'
-            
+            advance_status('generating')
+
             with st.spinner("Generating Kiro specification..."):
-                st.info("✨ **Step 3/3:** Creating structured requirements document")
-                
-                spec_content, project_name = convert_transcript_to_spec(transcription_text, selected_model_id)
+                # Render the model output progressively as chunks stream in,
+                # so the user sees the spec forming at first-token latency
+                # instead of a static spinner until the last token
+                stream_placeholder = st.empty()
+                stream_buffer = []
+
+                # Probe the destination bucket in the background while the
+                # model generates, so a bad bucket fails fast instead of
+                # after a multi-second generation
+                bucket_check = check_bucket_async(bucket_name, client=clients['s3'])
+
+                def _render_spec_delta(delta):
+                    # Deltas are fragments of the tool-input JSON, not
+                    # plain text: pull out however much of the
+                    # specification_content value has streamed in and
+                    # unescape it before rendering, so the user sees the
+                    # forming document rather than an escaped JSON blob
+                    stream_buffer.append(delta)
+                    match = _SPEC_VALUE_RE.search(''.join(stream_buffer))
+                    if not match:
+                        return
+                    try:
+                        partial_spec = json.loads(f'"{match.group(1)}"')
+                    except ValueError:
+                        # Mid-escape (e.g. half a \uXXXX); the next delta
+                        # completes it
+                        return
+                    stream_placeholder.markdown(partial_spec)
+
+                transcript_hash = hashlib.sha256(transcription_text.encode()).hexdigest()
+                spec_content, project_name = _cached_spec(
+                    transcript_hash, transcription_text, selected_model_id,
+                    _on_delta=_render_spec_delta
+                )
+                stream_placeholder.empty()
                 st.session_state.project_name = project_name
                 
                 # Step 4: Create local project folder and save requirements.md
                 create_project_folder(project_name, spec_content)
                 
-                # Step 5: Upload requirements.md to S3
-                s3_requirements_uri = upload_requirements_to_s3(bucket_name, project_name, spec_content)
-                st.write(f"✅ Requirements uploaded to S3: {s3_requirements_uri}")
-            
-            # Mark as complete
+                # Step 5: Upload requirements.md to S3, surfacing any
+                # bucket problem found by the background probe first
+                bucket_check.result()
+                s3_requirements_uri = aws_retry(upload_requirements_to_s3)(bucket_name, project_name, spec_content, client=clients['s3'])
+
+            # Mark as complete - the rerun renders the status panel once in
+            # its terminal state
             st.session_state.processing_status = 'complete'
-            st.success("✅ Processing complete!")
             st.rerun()
             
         except Exception as e:
-            # Handle any errors in the workflow
-            import traceback
-            error_details = f"{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
-            st.session_state.error_message = error_details
+            # Log the full traceback server-side; the UI shows only the
+            # concise message plus an opt-in technical-details view
+            logger.exception("Pipeline failed")
+            st.session_state.error_message = str(e)
+            st.session_state._last_exception = e
             st.session_state.processing_status = 'error'
             st.rerun()
     
     # Footer with spacing
     st.markdown("<br><br>", unsafe_allow_html=True)
     st.markdown("---")
-    st.markdown(
-        "<div style='text-align: center; color: #666;'>"
-        "Powered by Amazon Transcribe & Bedrock Claude Models"
-        "</div>",
-        unsafe_allow_html=True
-    )
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":